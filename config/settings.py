@@ -16,6 +16,7 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 # Google Calendar settings
 DEFAULT_TIMEZONE = "Asia/Jerusalem"
 DEFAULT_APPOINTMENT_DURATION = 60  # minutes
+GOOGLE_API_TIMEOUT = 10  # seconds per Calendar API request
 
 # Reminder settings
 DEFAULT_REMINDERS = {
@@ -44,3 +45,6 @@ TWILIO_PHONE_NUMBER = os.getenv('TWILIO_PHONE_NUMBER')
 # Flask settings
 FLASK_ENV = os.getenv('FLASK_ENV', 'development')
 FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+
+# CrewAI settings (verbose step logging only while debugging)
+CREW_VERBOSE = FLASK_DEBUG
@@ -1,37 +1,74 @@
 from crewai import Agent, Crew, Task, Process
 from crewai.flow.flow import Flow, listen, router, start
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Optional
+from collections import OrderedDict
 from pathlib import Path
+import asyncio
+import logging
 import os
-import json
 import re
+import orjson
+import threading
+import time
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # CREWAI CONFIGURATION
 # =============================================================================
 
-# Load environment variables FIRST (with override to ensure fresh load)
-load_dotenv(override=True)
+# Load environment variables FIRST, skipping the .env read when the process
+# environment already provides the key (e.g. inherited by a forked worker)
+if not os.getenv('OPENAI_API_KEY'):
+    load_dotenv()
 
 # Import google_calendar_helper AFTER loading .env
 from google_calendar_helper import get_calendar_helper
+from config.settings import CREW_VERBOSE
 
 # Set OpenAI API key for CrewAI
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', 'your-openai-api-key-here')
-os.environ['OPENAI_API_KEY'] = OPENAI_API_KEY
+os.environ.setdefault('OPENAI_API_KEY', OPENAI_API_KEY)
 
 # Load configuration files
 CONFIG_DIR = Path(__file__).parent / "config"
 
+# Parsed configs keyed by path, invalidated when (mtime_ns, size, inode) changes
+_yaml_cache: dict[str, tuple[tuple[int, int, int], dict]] = {}
+_yaml_cache_lock = threading.Lock()
+
 def load_yaml_config(filename: str) -> dict:
-    """Load YAML configuration file with UTF-8 encoding for Hebrew support"""
+    """
+    Load YAML configuration file with UTF-8 encoding for Hebrew support
+
+    Results are cached per file and re-parsed only when the file changes on disk.
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    path = str(CONFIG_DIR / filename)
     try:
-        with open(CONFIG_DIR / filename, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        with _yaml_cache_lock:
+            cached = _yaml_cache.get(path)
+            if cached and cached[0] == signature:
+                return cached[1]
+
+            with open(path, 'r', encoding='utf-8') as file:
+                config = yaml.load(file.read(), Loader=YamlLoader)
+
+            _yaml_cache[path] = (signature, config)
+            return config
     except Exception as e:
         raise RuntimeError(f"Failed to load {filename}: {e}")
 
@@ -40,12 +77,45 @@ AGENTS_CONFIG = load_yaml_config("agents.yaml")
 TASKS_CONFIG = load_yaml_config("tasks.yaml")
 MESSAGES_CONFIG = load_yaml_config("messages.yaml")
 
+# Outermost {...} block in an LLM response
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Keywords that mark a booking request; only used together with a concrete date/time
+_APPOINTMENT_KEYWORDS_RE = re.compile(
+    r'\b(schedule|appointment|book|meeting|קבע|פגישה|תור)\b', re.IGNORECASE
+)
+# An explicit time/date shape, today/tomorrow or a weekday. Bare digits ("for 2
+# people") don't count, and Hebrew weekdays only after יום, since on their own
+# שני/ראשון are also numbers/ordinals. Hebrew words may carry a ל/ב/ו prefix.
+_DATETIME_TOKEN_RE = re.compile(
+    r'\b\d{1,2}:\d{2}\b|\b\d{1,2}\s*(am|pm)\b|\b\d{4}-\d{1,2}-\d{1,2}\b|\b\d{1,2}/\d{1,2}\b'
+    r'|\bat \d{1,2}\b|בשעה \d|\bב-?\d{1,2}\b'
+    r'|\b(today|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b'
+    r'|\b[לבו]?(היום|מחר)\b|\b[לבו]?יום (ראשון|שני|שלישי|רביעי|חמישי|שישי|שבת)\b',
+    re.IGNORECASE
+)
+# Questions, negations and cancel/reschedule requests always go to the LLM router
+_QUESTION_RE = re.compile(
+    r'\?|\b(how|what|when|where|why|can|could|do|does|is|are|איך|מה|מתי|איפה|למה|האם)\b',
+    re.IGNORECASE
+)
+_NEGATION_RE = re.compile(
+    r"\b(cancel\w*|reschedule\w*|postpone\w*|move|not|no|don'?t|never|לא|אל)\b|בטל|ביטול|לדחות|להזיז",
+    re.IGNORECASE
+)
+
+# Any character in the Hebrew Unicode block
+_HEBREW_RE = re.compile(r'[\u0590-\u05FF]')
+
 # =============================================================================
 # STATE MODEL
 # =============================================================================
 
 class AppointmentState(BaseModel):
     """State that flows through the system"""
+    # Internal state written several times per request; skip per-assignment validation
+    model_config = ConfigDict(validate_assignment=False)
+
     user_message: str = ""
     user_phone: str = ""
     category: str = ""  # GENERAL, APPOINTMENT, UNRELATED
@@ -62,6 +132,69 @@ router_agent = Agent(**AGENTS_CONFIG['router_agent'])
 general_agent = Agent(**AGENTS_CONFIG['general_agent'])
 extractor_agent = Agent(**AGENTS_CONFIG['extractor_agent'])
 
+# =============================================================================
+# LLM RESULT CACHE
+# =============================================================================
+
+# Parsed router/extractor outputs keyed by normalized input (LRU eviction)
+LLM_CACHE_SIZE = 2048
+_llm_cache: OrderedDict = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+def _llm_cache_get(key: tuple) -> Optional[dict]:
+    """Return a copy of the cached LLM result for key, or None on a miss"""
+    with _llm_cache_lock:
+        value = _llm_cache.get(key)
+        if value is None:
+            return None
+        _llm_cache.move_to_end(key)
+        return dict(value)
+
+def _llm_cache_put(key: tuple, value: dict):
+    """Store a parsed LLM result; empty (failed) parses are not cached"""
+    if not value:
+        return
+    with _llm_cache_lock:
+        _llm_cache[key] = dict(value)
+        _llm_cache.move_to_end(key)
+        if len(_llm_cache) > LLM_CACHE_SIZE:
+            _llm_cache.popitem(last=False)
+
+def _has_hebrew(message: str) -> bool:
+    """Check for Hebrew characters with a single C-level regex scan"""
+    return _HEBREW_RE.search(message) is not None
+
+def _fast_route(message: str) -> Optional[dict]:
+    """
+    Classify obvious appointment requests without an LLM call; None means ask the router
+
+    Matches the router's own rule (APPOINTMENT has a specific date/time): a booking
+    keyword plus a concrete date/time token, and no question or cancel/negation words.
+    """
+    if not _APPOINTMENT_KEYWORDS_RE.search(message) or not _DATETIME_TOKEN_RE.search(message):
+        return None
+    if _QUESTION_RE.search(message) or _NEGATION_RE.search(message):
+        return None
+
+    language = "hebrew" if _has_hebrew(message) else "english"
+    return {"category": "APPOINTMENT", "language": language}
+
+# Today's date is recomputed at most once a minute so bursts share one extraction cache key
+TODAY_TTL_SECONDS = 60
+_today_cache = (0.0, "")
+
+def _today_str() -> str:
+    """Return today's date as YYYY-MM-DD, memoized until the TTL or local midnight, whichever is first"""
+    global _today_cache
+    now = time.time()
+    expires_at, today = _today_cache
+    if now >= expires_at:
+        current = date.today()
+        next_midnight = datetime.combine(current + timedelta(days=1), datetime.min.time()).timestamp()
+        today = current.isoformat()
+        _today_cache = (min(now + TODAY_TTL_SECONDS, next_midnight), today)
+    return today
+
 # =============================================================================
 # APPOINTMENT FLOW
 # =============================================================================
@@ -79,30 +212,28 @@ class AppointmentFlow(Flow[AppointmentState]):
     # STEP 1: Route the message
     # -------------------------------------------------------------------------
     @start()
-    def route_message(self):
-        """First step: classify the incoming message"""
-        print(f"\n🔍 Routing: {self.state.user_message}")
-
-        # Load task description from YAML
-        description = TASKS_CONFIG['route_message']['description'].format(
-            user_message=self.state.user_message
+    async def route_message(self):
+        """
+        First step: classify the incoming message
+
+        Date/time extraction is independent of the classification, so it runs
+        speculatively alongside the router. Its result is kept only when the
+        message turns out to be an APPOINTMENT.
+        """
+        logger.info("🔍 Routing: %s", self.state.user_message)
+
+        data, extracted = await asyncio.gather(
+            self._run_router(),
+            self._run_speculative_extractor()
         )
 
-        task = Task(
-            description=description,
-            expected_output=TASKS_CONFIG['route_message']['expected_output'],
-            agent=router_agent
-        )
-
-        crew = Crew(agents=[router_agent], tasks=[task], verbose=True)
-        result = str(crew.kickoff())
-
-        # Parse result
-        data = self._parse_json(result)
         self.state.category = data.get("category", "UNRELATED").upper()
         self.state.language = data.get("language", "english")
 
-        print(f"📊 Category: {self.state.category}, Language: {self.state.language}")
+        if "APPOINTMENT" in self.state.category:
+            self.state.calendar_data = extracted
+
+        logger.info("📊 Category: %s, Language: %s", self.state.category, self.state.language)
         return self.state.category
 
     # -------------------------------------------------------------------------
@@ -122,34 +253,20 @@ class AppointmentFlow(Flow[AppointmentState]):
     # PATH A: Appointment Creation (פגישה)
     # -------------------------------------------------------------------------
     @listen("appointment")
-    def extract_datetime(self):
+    async def extract_datetime(self):
         """Extract date/time from appointment request"""
-        print(f"\n📅 Extracting datetime...")
+        logger.info("📅 Extracting datetime...")
 
-        today = datetime.now().strftime("%Y-%m-%d")
+        # Normally already filled in by the speculative run in route_message
+        if self.state.calendar_data is None:
+            self.state.calendar_data = await self._run_extractor()
 
-        # Load task description from YAML
-        description = TASKS_CONFIG['extract_datetime']['description'].format(
-            user_message=self.state.user_message,
-            today=today
-        )
-
-        task = Task(
-            description=description,
-            expected_output=TASKS_CONFIG['extract_datetime']['expected_output'],
-            agent=extractor_agent
-        )
-
-        crew = Crew(agents=[extractor_agent], tasks=[task], verbose=True)
-        result = str(crew.kickoff())
-
-        self.state.calendar_data = self._parse_json(result)
-        print(f"📊 Extracted: {self.state.calendar_data}")
+        logger.info("📊 Extracted: %s", self.state.calendar_data)
 
     @listen(extract_datetime)
-    def create_calendar_event(self):
+    async def create_calendar_event(self):
         """Create event in Google Calendar"""
-        print(f"\n🗓️ Creating calendar event...")
+        logger.info("🗓️ Creating calendar event...")
 
         if not self.state.calendar_data:
             # Load error message from YAML
@@ -160,7 +277,7 @@ class AppointmentFlow(Flow[AppointmentState]):
 
         # Create event using Google Calendar Helper
         calendar_helper = get_calendar_helper()
-        result = calendar_helper.create_event(
+        result = await calendar_helper.acreate_event(
             title=event_data.get('title', 'Appointment'),
             date=event_data.get('date'),
             time=event_data.get('time'),
@@ -174,11 +291,11 @@ class AppointmentFlow(Flow[AppointmentState]):
         self.state.response = result['message']
 
         if result['success']:
-            print(f"✅ Event created successfully!")
+            logger.info("✅ Event created successfully!")
             if result.get('event_link'):
-                print(f"🔗 Event link: {result['event_link']}")
+                logger.info("🔗 Event link: %s", result['event_link'])
         else:
-            print(f"❌ Event creation failed: {result['message']}")
+            logger.warning("❌ Event creation failed: %s", result['message'])
 
     # -------------------------------------------------------------------------
     # PATH B: General Questions (כללי)
@@ -186,7 +303,7 @@ class AppointmentFlow(Flow[AppointmentState]):
     @listen("general")
     def answer_general_question(self):
         """Answer general scheduling questions"""
-        print(f"\n💬 Answering general question...")
+        logger.info("💬 Answering general question...")
 
         # Load task description from YAML
         description = TASKS_CONFIG['answer_general']['description'].format(
@@ -200,10 +317,10 @@ class AppointmentFlow(Flow[AppointmentState]):
             agent=general_agent
         )
 
-        crew = Crew(agents=[general_agent], tasks=[task], verbose=True)
+        crew = Crew(agents=[general_agent], tasks=[task], verbose=CREW_VERBOSE)
         self.state.response = str(crew.kickoff())
 
-        print(f"💬 Response ready")
+        logger.info("💬 Response ready")
 
     # -------------------------------------------------------------------------
     # PATH C: Unrelated Message
@@ -211,7 +328,7 @@ class AppointmentFlow(Flow[AppointmentState]):
     @listen("unrelated")
     def handle_unrelated(self):
         """Handle messages not related to scheduling"""
-        print(f"\n🚫 Unrelated message...")
+        logger.info("🚫 Unrelated message...")
 
         # Load unrelated message from YAML
         self.state.response = MESSAGES_CONFIG['responses']['unrelated'][self.state.language]
@@ -224,8 +341,8 @@ class AppointmentFlow(Flow[AppointmentState]):
     @listen(handle_unrelated)
     def send_to_whatsapp(self):
         """Send the response back to WhatsApp"""
-        print(f"\n📤 Sending to WhatsApp: {self.state.user_phone}")
-        print(f"📨 Response: {self.state.response}")
+        logger.info("📤 Sending to WhatsApp: %s", self.state.user_phone)
+        logger.info("📨 Response: %s", self.state.response)
 
         # ====== TWILIO WHATSAPP API CALL WOULD GO HERE ======
         # from twilio.rest import Client
@@ -240,15 +357,80 @@ class AppointmentFlow(Flow[AppointmentState]):
         return self.state.response
 
     # -------------------------------------------------------------------------
-    # HELPER
+    # HELPERS
     # -------------------------------------------------------------------------
+    async def _run_router(self) -> dict:
+        """Classify the message, skipping the LLM for obvious or repeated inputs"""
+        fast = _fast_route(self.state.user_message)
+        if fast:
+            return fast
+
+        key = ("route", self.state.user_message.strip().lower())
+
+        data = _llm_cache_get(key)
+        if data is None:
+            result = await self._router_crew().kickoff_async()
+            data = self._parse_json(str(result))
+            _llm_cache_put(key, data)
+        return data
+
+    async def _run_speculative_extractor(self) -> Optional[dict]:
+        """Run the extractor ahead of routing; a failure here must not fail the flow"""
+        try:
+            return await self._run_extractor()
+        except Exception as e:
+            # extract_datetime re-runs it if the message is an APPOINTMENT
+            logger.warning("⚠️ Speculative extraction failed: %s", e)
+            return None
+
+    async def _run_extractor(self) -> dict:
+        """Extract date/time, reusing the cached result for repeated inputs on the same day"""
+        today = _today_str()
+        key = ("extract", self.state.user_message.strip(), today)
+
+        data = _llm_cache_get(key)
+        if data is None:
+            result = await self._extractor_crew(today).kickoff_async()
+            data = self._parse_json(str(result))
+            _llm_cache_put(key, data)
+        return data
+
+    def _router_crew(self) -> Crew:
+        """Build the crew that classifies the message (task from YAML)"""
+        description = TASKS_CONFIG['route_message']['description'].format(
+            user_message=self.state.user_message
+        )
+
+        task = Task(
+            description=description,
+            expected_output=TASKS_CONFIG['route_message']['expected_output'],
+            agent=router_agent
+        )
+
+        return Crew(agents=[router_agent], tasks=[task], verbose=CREW_VERBOSE)
+
+    def _extractor_crew(self, today: str) -> Crew:
+        """Build the crew that extracts appointment date/time (task from YAML)"""
+        description = TASKS_CONFIG['extract_datetime']['description'].format(
+            user_message=self.state.user_message,
+            today=today
+        )
+
+        task = Task(
+            description=description,
+            expected_output=TASKS_CONFIG['extract_datetime']['expected_output'],
+            agent=extractor_agent
+        )
+
+        return Crew(agents=[extractor_agent], tasks=[task], verbose=CREW_VERBOSE)
+
     def _parse_json(self, text: str) -> dict:
         """Extract JSON from text"""
         try:
-            match = re.search(r'\{.*\}', text, re.DOTALL)
+            match = _JSON_RE.search(text)
             if match:
-                return json.loads(match.group())
-        except:
+                return orjson.loads(match.group())
+        except orjson.JSONDecodeError:
             pass
         return {}
 
@@ -256,13 +438,13 @@ class AppointmentFlow(Flow[AppointmentState]):
 # MAIN FUNCTIONS
 # =============================================================================
 
-def process_whatsapp_message(message: str, phone: str = "") -> str:
+async def process_whatsapp_message(message: str, phone: str = "") -> str:
     """Process a WhatsApp message through the flow"""
     flow = AppointmentFlow()
     flow.state.user_message = message
     flow.state.user_phone = phone
 
-    result = flow.kickoff()
+    await flow.kickoff_async()
     return flow.state.response
 
 # =============================================================================
@@ -270,6 +452,8 @@ def process_whatsapp_message(message: str, phone: str = "") -> str:
 # =============================================================================
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     test_messages = [
         ("Schedule a meeting for tomorrow at 3pm", "+972501234567"),
         ("How do I book an appointment?", "+972501234567"),
@@ -287,7 +471,7 @@ if __name__ == "__main__":
         print(f"📱 Phone: {phone}")
         print("="*60)
 
-        response = process_whatsapp_message(msg, phone)
+        response = asyncio.run(process_whatsapp_message(msg, phone))
 
         print(f"\n✅ FINAL RESPONSE:")
         print(response)
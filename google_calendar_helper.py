@@ -3,12 +3,23 @@ Google Calendar Helper Module
 Handles all Google Calendar API operations for appointment scheduling
 """
 
+import asyncio
+import bisect
+import logging
 import os
-import json
+import random
+import re
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from operator import itemgetter
+from time import monotonic, sleep
+from typing import Optional, Dict, List, Tuple
 from zoneinfo import ZoneInfo
+import httplib2
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
@@ -17,9 +28,12 @@ from config.settings import (
     GOOGLE_CREDENTIALS_PATH,
     GOOGLE_CALENDAR_ID,
     DEFAULT_TIMEZONE,
-    DEFAULT_REMINDERS
+    DEFAULT_REMINDERS,
+    GOOGLE_API_TIMEOUT
 )
 
+logger = logging.getLogger(__name__)
+
 # Timezone constants
 ISRAEL_TZ = ZoneInfo(DEFAULT_TIMEZONE)  # Asia/Jerusalem
 UTC_TZ = ZoneInfo('UTC')
@@ -31,10 +45,204 @@ UTC_TZ = ZoneInfo('UTC')
 # Google Calendar API scopes
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Threads running blocking Calendar calls for acreate_event
+CALENDAR_WORKERS = 8
+
+# Maximum number of sub-requests Google accepts in one batch request
+BATCH_SIZE = 50
+
+# How long a day's busy intervals are reused before querying the API again
+BUSY_CACHE_TTL_SECONDS = 30
+
+# Appointment date (YYYY-MM-DD) and 24-hour time (HH:MM) as given by the extractor
+_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{1,2})')
+
+# Fixed parts of every inserted event body (see _build_event_body)
+_EVENT_TEMPLATE = {
+    'reminders': DEFAULT_REMINDERS,
+    'start': {'timeZone': DEFAULT_TIMEZONE},
+    'end': {'timeZone': DEFAULT_TIMEZONE},
+}
+
+# Retry policy for Calendar API calls (exponential backoff with jitter)
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.25  # seconds
+RETRY_STATUSES = {403, 429, 500, 502, 503, 504}
+
+# Statuses where the request was rejected before doing anything, so even
+# non-idempotent calls (events().insert) can safely be repeated
+RATE_LIMIT_STATUSES = {403, 429}
+
+
+def _load_credentials_info() -> Optional[Dict]:
+    """Parse the service account JSON from GOOGLE_CALENDAR_CREDENTIALS (for Railway), if set"""
+    google_creds_json = os.getenv('GOOGLE_CALENDAR_CREDENTIALS')
+    if not google_creds_json:
+        return None
+
+    try:
+        return orjson.loads(google_creds_json)
+    except orjson.JSONDecodeError as e:
+        logger.error("❌ GOOGLE_CALENDAR_CREDENTIALS is not valid JSON: %s", e)
+        return None
+
+
+# Parsed once at import so helper re-initialization never re-parses it
+_CREDS_INFO = _load_credentials_info()
+
+# Service account credentials by source, built once per process
+_credentials_cache: Dict[str, service_account.Credentials] = {}
+
+
+def _load_credentials(credentials_path: str) -> Optional[service_account.Credentials]:
+    """
+    Build service account credentials, reusing the ones already built in this process
+
+    Args:
+        credentials_path: Credentials file used when GOOGLE_CALENDAR_CREDENTIALS is not set
+
+    Returns:
+        Credentials, or None if no credentials are configured
+    """
+    source = 'env' if _CREDS_INFO else credentials_path
+    credentials = _credentials_cache.get(source)
+    if credentials is not None:
+        return credentials
+
+    # Try credentials from environment variable first (for Railway)
+    if _CREDS_INFO:
+        logger.info("📋 Loading Google Calendar credentials from environment variable")
+        credentials = service_account.Credentials.from_service_account_info(
+            _CREDS_INFO,
+            scopes=SCOPES
+        )
+    elif os.path.exists(credentials_path):
+        # Load credentials from file (for local development)
+        logger.info("📋 Loading Google Calendar credentials from file: %s", credentials_path)
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_path,
+            scopes=SCOPES
+        )
+    else:
+        return None
+
+    _credentials_cache[source] = credentials
+    return credentials
+
+# =============================================================================
+# RESPONSE MESSAGES
+# =============================================================================
+
+_MSG_NOT_CONFIGURED = {
+    'hebrew': "❌ שירות גוגל קלנדר לא מוגדר. אנא הגדר את קובץ האישורים.",
+    'english': "❌ Google Calendar service not configured. Please set up credentials file.",
+}
+
+_MSG_CONFLICT = {
+    'hebrew': """⚠️ המשבצת תפוסה!
+📅 תאריך: {date}
+🕐 שעה: {time}
+❌ הזמן הזה כבר תפוס
+
+אנא בחר זמן אחר.""",
+    'english': """⚠️ Time slot is occupied!
+📅 Date: {date}
+🕐 Time: {time}
+❌ This time is already booked
+
+Please choose another time.""",
+}
+
+_MSG_SUCCESS = {
+    'hebrew': """✅ הפגישה נקבעה בהצלחה!
+📅 תאריך: {date}
+🕐 שעה: {time}
+⏱️ משך: {duration} דקות
+📝 נושא: {title}""",
+    'english': """✅ Appointment scheduled successfully!
+📅 Date: {date}
+🕐 Time: {time}
+⏱️ Duration: {duration} minutes
+📝 Title: {title}""",
+}
+
+_MSG_API_ERROR = {
+    'hebrew': "❌ שגיאה בקביעת הפגישה: {error}",
+    'english': "❌ Error scheduling appointment: {error}",
+}
+
+_MSG_UNEXPECTED_ERROR = {
+    'hebrew': "❌ שגיאה לא צפויה: {error}",
+    'english': "❌ Unexpected error: {error}",
+}
+
+
+def _format_message(table: Dict[str, str], language: str, **fields) -> str:
+    """Fill in a message template for the given language (English unless Hebrew)"""
+    template = table['hebrew'] if language == "hebrew" else table['english']
+    return template.format_map(fields)
+
+def _is_retryable(error: HttpError, statuses: set) -> bool:
+    """Check whether a Calendar API error is worth retrying"""
+    status = error.resp.status
+    if status not in statuses:
+        return False
+    if status == 403:
+        # 403 is also used for permission errors, which a retry won't fix
+        return b'ratelimitexceeded' in (error.content or b'').lower()
+    return True
+
+
+def _with_retry(fn, attempts: int = RETRY_ATTEMPTS, base: float = RETRY_BASE_DELAY,
+                statuses: set = RETRY_STATUSES):
+    """
+    Call fn, retrying rate-limit and transient Calendar API errors
+
+    Args:
+        fn: Zero-argument callable performing the API request
+        attempts: Maximum number of calls
+        base: Delay before the first retry, doubled on every further retry
+        statuses: HTTP statuses to retry
+
+    Returns:
+        Whatever fn returns
+    """
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except HttpError as error:
+            if attempt == attempts - 1 or not _is_retryable(error, statuses):
+                raise
+            delay = base * 2 ** attempt + random.random() * 0.1
+            logger.warning("⚠️ Calendar API error %s, retrying in %.2fs", error.resp.status, delay)
+            sleep(delay)
+
+
+def _rfc3339(dt: datetime) -> str:
+    """Format an aware datetime as an RFC3339 UTC timestamp (YYYY-MM-DDTHH:MM:SSZ)"""
+    return dt.astimezone(UTC_TZ).replace(tzinfo=None).isoformat(timespec='seconds') + 'Z'
+
+
+def _merge_intervals(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Sort (start, end) intervals and merge overlapping ones"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
 # =============================================================================
 # GOOGLE CALENDAR API CLIENT
 # =============================================================================
 
+# Long-lived threads for acreate_event. asyncio.to_thread would use the default
+# executor of the calling event loop, and Flask creates (and closes) a new loop
+# per request, so the per-thread keep-alive transports would never be reused.
+_calendar_executor = ThreadPoolExecutor(max_workers=CALENDAR_WORKERS, thread_name_prefix="calendar")
+
 class GoogleCalendarHelper:
     """Helper class for Google Calendar API operations"""
 
@@ -43,46 +251,72 @@ class GoogleCalendarHelper:
         self.credentials_path = GOOGLE_CREDENTIALS_PATH
         self.calendar_id = GOOGLE_CALENDAR_ID
         self.service = None
+        self.credentials = None
+        self._local = threading.local()
+
+        # Israel-midnight day start -> (fetched_at, busy (start_ts, end_ts) list);
+        # a None list marks a day invalidated at that time by a new booking.
+        # Entries older than BUSY_CACHE_TTL_SECONDS are pruned on every write.
+        self._busy_cache: Dict[datetime, Tuple[float, Optional[List[Tuple[float, float]]]]] = {}
+        self._busy_cache_lock = threading.Lock()
+
         self._initialize_service()
 
     def _initialize_service(self):
         """Initialize Google Calendar API service with service account credentials"""
         try:
-            # Try to load credentials from environment variable first (for Railway)
-            google_creds_json = os.getenv('GOOGLE_CALENDAR_CREDENTIALS')
-
-            if google_creds_json:
-                # Load credentials from environment variable
-                print("📋 Loading Google Calendar credentials from environment variable")
-                credentials_info = json.loads(google_creds_json)
-                credentials = service_account.Credentials.from_service_account_info(
-                    credentials_info,
-                    scopes=SCOPES
-                )
-            elif os.path.exists(self.credentials_path):
-                # Load credentials from file (for local development)
-                print(f"📋 Loading Google Calendar credentials from file: {self.credentials_path}")
-                credentials = service_account.Credentials.from_service_account_file(
-                    self.credentials_path,
-                    scopes=SCOPES
-                )
-            else:
-                print(f"❌ Google Calendar credentials not found")
-                print("   Set GOOGLE_CALENDAR_CREDENTIALS env var or provide credentials file")
-                print("⚠️  Calendar integration will be disabled")
+            credentials = _load_credentials(self.credentials_path)
+            if credentials is None:
+                logger.error("❌ Google Calendar credentials not found")
+                logger.error("   Set GOOGLE_CALENDAR_CREDENTIALS env var or provide credentials file")
+                logger.warning("⚠️  Calendar integration will be disabled")
                 self.service = None
                 return
 
-            # Build the Calendar API service
-            self.service = build('calendar', 'v3', credentials=credentials)
-            print(f"✅ Google Calendar service initialized successfully")
-            print(f"📅 Using calendar: {self.calendar_id}")
+            self.credentials = credentials
+
+            # Build the Calendar API service from the discovery doc bundled with
+            # the client library (no network fetch). Requests are executed with
+            # the per-thread transport from _authorized_http().
+            self.service = build(
+                'calendar', 'v3',
+                credentials=credentials,
+                static_discovery=True,
+                cache_discovery=False
+            )
+            logger.info("✅ Google Calendar service initialized successfully")
+            logger.info("📅 Using calendar: %s", self.calendar_id)
 
         except Exception as e:
-            print(f"❌ Error initializing Google Calendar service: {str(e)}")
-            print("⚠️  Calendar integration will be disabled")
+            logger.error("❌ Error initializing Google Calendar service: %s", e)
+            logger.warning("⚠️  Calendar integration will be disabled")
             self.service = None
 
+    def _authorized_http(self) -> AuthorizedHttp:
+        """
+        Authorized keep-alive transport for the calling thread
+
+        httplib2.Http is not thread-safe, so each thread gets its own, reused for
+        all of that thread's requests so TCP/TLS handshakes are paid once.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(
+                self.credentials,
+                http=httplib2.Http(timeout=GOOGLE_API_TIMEOUT)
+            )
+            self._local.http = http
+        return http
+
+    def reset_connections(self):
+        """
+        Drop all pooled connections
+
+        Called in each gunicorn worker after fork so workers never share
+        sockets opened by the parent process.
+        """
+        self._local = threading.local()
+
     def create_event(self,
                      title: str,
                      date: str,
@@ -107,20 +341,12 @@ class GoogleCalendarHelper:
 
         # Check if service is initialized
         if self.service is None:
-            if language == "hebrew":
-                return {
-                    'success': False,
-                    'message': "❌ שירות גוגל קלנדר לא מוגדר. אנא הגדר את קובץ האישורים.",
-                    'event_link': None,
-                    'event_id': None
-                }
-            else:
-                return {
-                    'success': False,
-                    'message': "❌ Google Calendar service not configured. Please set up credentials file.",
-                    'event_link': None,
-                    'event_id': None
-                }
+            return {
+                'success': False,
+                'message': _format_message(_MSG_NOT_CONFIGURED, language),
+                'event_link': None,
+                'event_id': None
+            }
 
         try:
             # Parse date and time
@@ -130,20 +356,7 @@ class GoogleCalendarHelper:
             # Check for conflicts
             conflict = self._check_time_conflict(start_datetime, end_datetime)
             if conflict:
-                if language == "hebrew":
-                    message = f"""⚠️ המשבצת תפוסה!
-📅 תאריך: {date}
-🕐 שעה: {time}
-❌ הזמן הזה כבר תפוס
-
-אנא בחר זמן אחר."""
-                else:
-                    message = f"""⚠️ Time slot is occupied!
-📅 Date: {date}
-🕐 Time: {time}
-❌ This time is already booked
-
-Please choose another time."""
+                message = _format_message(_MSG_CONFLICT, language, date=date, time=time)
 
                 return {
                     'success': False,
@@ -153,39 +366,25 @@ Please choose another time."""
                 }
 
             # Prepare event body
-            event = {
-                'summary': title,
-                'description': notes,
-                'start': {
-                    'dateTime': start_datetime.isoformat(),
-                    'timeZone': DEFAULT_TIMEZONE,
-                },
-                'end': {
-                    'dateTime': end_datetime.isoformat(),
-                    'timeZone': DEFAULT_TIMEZONE,
-                },
-                'reminders': DEFAULT_REMINDERS,
-            }
+            event = self._build_event_body(title, notes, start_datetime, end_datetime)
 
-            # Create the event
-            created_event = self.service.events().insert(
+            # Create the event (only rate limiting is retried, so a request
+            # that may have gone through is never inserted twice)
+            insert_request = self.service.events().insert(
                 calendarId=self.calendar_id,
                 body=event
-            ).execute()
+            )
+            created_event = _with_retry(
+                lambda: insert_request.execute(http=self._authorized_http()),
+                statuses=RATE_LIMIT_STATUSES
+            )
+            self._invalidate_busy_cache(start_datetime, end_datetime)
 
             # Prepare success message
-            if language == "hebrew":
-                message = f"""✅ הפגישה נקבעה בהצלחה!
-📅 תאריך: {date}
-🕐 שעה: {time}
-⏱️ משך: {duration} דקות
-📝 נושא: {title}"""
-            else:
-                message = f"""✅ Appointment scheduled successfully!
-📅 Date: {date}
-🕐 Time: {time}
-⏱️ Duration: {duration} minutes
-📝 Title: {title}"""
+            message = _format_message(
+                _MSG_SUCCESS, language,
+                date=date, time=time, duration=duration, title=title
+            )
 
             return {
                 'success': True,
@@ -195,12 +394,9 @@ Please choose another time."""
             }
 
         except HttpError as error:
-            print(f"❌ Google Calendar API error: {error}")
+            logger.error("❌ Google Calendar API error: %s", error)
 
-            if language == "hebrew":
-                error_message = f"❌ שגיאה בקביעת הפגישה: {str(error)}"
-            else:
-                error_message = f"❌ Error scheduling appointment: {str(error)}"
+            error_message = _format_message(_MSG_API_ERROR, language, error=error)
 
             return {
                 'success': False,
@@ -210,12 +406,9 @@ Please choose another time."""
             }
 
         except Exception as e:
-            print(f"❌ Unexpected error creating calendar event: {str(e)}")
+            logger.exception("❌ Unexpected error creating calendar event: %s", e)
 
-            if language == "hebrew":
-                error_message = f"❌ שגיאה לא צפויה: {str(e)}"
-            else:
-                error_message = f"❌ Unexpected error: {str(e)}"
+            error_message = _format_message(_MSG_UNEXPECTED_ERROR, language, error=e)
 
             return {
                 'success': False,
@@ -224,10 +417,180 @@ Please choose another time."""
                 'event_id': None
             }
 
+    def create_events_bulk(self, events: List[Dict], language: str = "english") -> List[Dict]:
+        """
+        Create several calendar events with one conflict query and batched inserts
+
+        Conflicts are detected client-side against a single freebusy query
+        covering all requested slots (the same source create_event uses, so
+        transparent "free" events never block a slot) and against earlier events
+        in the same call; the accepted events are inserted via the batch endpoint.
+
+        Args:
+            events: List of dicts with 'title', 'date', 'time' and optional 'duration', 'notes'
+            language: Language for response messages (hebrew/english)
+
+        Returns:
+            List of result dicts, in the same order and shape as create_event() results
+        """
+        if self.service is None:
+            message = _format_message(_MSG_NOT_CONFIGURED, language)
+            return [
+                {'success': False, 'message': message, 'event_link': None, 'event_id': None}
+                for _ in events
+            ]
+
+        results: List[Optional[Dict]] = [None] * len(events)
+
+        # Parse all requested slots first
+        slots = []
+        for index, event_data in enumerate(events):
+            try:
+                start_datetime = self._parse_datetime(event_data.get('date'), event_data.get('time'))
+                end_datetime = start_datetime + timedelta(minutes=int(event_data.get('duration', 60)))
+            except (TypeError, ValueError) as e:
+                message = _format_message(_MSG_UNEXPECTED_ERROR, language, error=e)
+                results[index] = {'success': False, 'message': message, 'event_link': None, 'event_id': None}
+                continue
+
+            slots.append((index, event_data, start_datetime, end_datetime))
+
+        if not slots:
+            return results
+
+        try:
+            # One freebusy query over the union of all requested windows
+            busy = self._query_busy_intervals(
+                min(slot[2] for slot in slots),
+                max(slot[3] for slot in slots)
+            )
+        except HttpError as error:
+            logger.error("❌ Google Calendar API error: %s", error)
+            message = _format_message(_MSG_API_ERROR, language, error=error)
+            for index, _, _, _ in slots:
+                results[index] = {'success': False, 'message': message, 'event_link': None, 'event_id': None}
+            return results
+        except Exception as e:
+            logger.exception("❌ Unexpected error checking for conflicts: %s", e)
+            message = _format_message(_MSG_UNEXPECTED_ERROR, language, error=e)
+            for index, _, _, _ in slots:
+                results[index] = {'success': False, 'message': message, 'event_link': None, 'event_id': None}
+            return results
+
+        # Reject conflicting slots, then queue the rest for insertion
+        to_insert = []
+        for index, event_data, start_datetime, end_datetime in slots:
+            start_ts = start_datetime.timestamp()
+            end_ts = end_datetime.timestamp()
+            date, time = event_data.get('date'), event_data.get('time')
+
+            if any(start_ts < busy_end and end_ts > busy_start for busy_start, busy_end in busy):
+                message = _format_message(_MSG_CONFLICT, language, date=date, time=time)
+                results[index] = {'success': False, 'message': message, 'event_link': None, 'event_id': None}
+                continue
+
+            # Later events in the same call must not overlap this one either
+            busy.append((start_ts, end_ts))
+            to_insert.append((index, event_data, start_datetime, end_datetime))
+
+        slot_by_index = {slot[0]: slot for slot in to_insert}
+
+        def on_response(request_id, created_event, exception):
+            index = int(request_id)
+            event_data = events[index]
+
+            if exception is not None:
+                logger.error("❌ Google Calendar API error: %s", exception)
+                message = _format_message(_MSG_API_ERROR, language, error=exception)
+                results[index] = {'success': False, 'message': message, 'event_link': None, 'event_id': None}
+                return
+
+            _, _, start_datetime, end_datetime = slot_by_index[index]
+            self._invalidate_busy_cache(start_datetime, end_datetime)
+
+            fields = {
+                'date': event_data.get('date'),
+                'time': event_data.get('time'),
+                'duration': int((end_datetime - start_datetime).total_seconds() // 60),
+                'title': event_data.get('title', 'Appointment'),
+            }
+            message = _format_message(_MSG_SUCCESS, language, **fields)
+            results[index] = {
+                'success': True,
+                'message': message,
+                'event_link': created_event.get('htmlLink'),
+                'event_id': created_event.get('id')
+            }
+
+        for offset in range(0, len(to_insert), BATCH_SIZE):
+            chunk = to_insert[offset:offset + BATCH_SIZE]
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for index, event_data, start_datetime, end_datetime in chunk:
+                body = self._build_event_body(
+                    event_data.get('title', 'Appointment'),
+                    event_data.get('notes', ''),
+                    start_datetime,
+                    end_datetime
+                )
+                batch.add(
+                    self.service.events().insert(calendarId=self.calendar_id, body=body),
+                    request_id=str(index)
+                )
+
+            try:
+                batch.execute(http=self._authorized_http())
+            except HttpError as error:
+                # The whole batch request failed; fill in every unanswered event
+                for index, _, _, _ in chunk:
+                    if results[index] is None:
+                        on_response(str(index), None, error)
+            except Exception as e:
+                # Socket/transport or parse failure; keep going so the events
+                # already created by earlier chunks are still reported
+                logger.exception("❌ Unexpected error creating calendar events: %s", e)
+                message = _format_message(_MSG_UNEXPECTED_ERROR, language, error=e)
+                for index, _, _, _ in chunk:
+                    if results[index] is None:
+                        results[index] = {'success': False, 'message': message, 'event_link': None, 'event_id': None}
+
+        # Events the batch response never answered
+        for index, result in enumerate(results):
+            if result is None:
+                message = _format_message(_MSG_UNEXPECTED_ERROR, language, error="no response from Google Calendar")
+                results[index] = {'success': False, 'message': message, 'event_link': None, 'event_id': None}
+
+        return results
+
+    async def acreate_event(self,
+                            title: str,
+                            date: str,
+                            time: str,
+                            duration: int = 60,
+                            notes: str = "",
+                            language: str = "english") -> Dict:
+        """
+        Async variant of create_event for use from coroutines
+
+        Runs the blocking conflict check + insert on the shared Calendar thread
+        pool, whose threads keep their pooled transports across messages, so
+        the event loop stays free.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _calendar_executor,
+            self.create_event, title, date, time, duration, notes, language
+        )
+
     def _check_time_conflict(self, start_datetime: datetime, end_datetime: datetime) -> Optional[Dict]:
         """
         Check if there's a conflicting event in the calendar
 
+        Uses the freebusy endpoint, which returns only busy intervals rather
+        than full event payloads. The per-day cache is per process, and other
+        gunicorn workers may have booked a slot since it was filled, so cached
+        intervals can only answer "busy"; a slot is declared free only after a
+        fresh query.
+
         Args:
             start_datetime: Start time of proposed event (timezone-aware, Israel time)
             end_datetime: End time of proposed event (timezone-aware, Israel time)
@@ -236,47 +599,195 @@ Please choose another time."""
             Dict with conflict details if found, None otherwise
         """
         try:
-            # Convert Israel time to UTC for API query
-            start_utc = start_datetime.astimezone(UTC_TZ)
-            end_utc = end_datetime.astimezone(UTC_TZ)
-
-            # Query events in the time range (API expects RFC3339 format)
-            events_result = self.service.events().list(
-                calendarId=self.calendar_id,
-                timeMin=start_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                timeMax=end_utc.strftime('%Y-%m-%dT%H:%M:%SZ'),
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            events = events_result.get('items', [])
-
-            # Check if any event overlaps
-            for event in events:
-                event_start = event['start'].get('dateTime', event['start'].get('date'))
-                event_end = event['end'].get('dateTime', event['end'].get('date'))
-
-                # Parse event times to timezone-aware datetimes
-                event_start_dt = self._parse_event_datetime(event_start)
-                event_end_dt = self._parse_event_datetime(event_end)
-
-                # Check for overlap (both are now timezone-aware)
-                if (start_datetime < event_end_dt and end_datetime > event_start_dt):
-                    # Convert to Israel time for display
-                    event_start_israel = event_start_dt.astimezone(ISRAEL_TZ)
-                    event_end_israel = event_end_dt.astimezone(ISRAEL_TZ)
-                    return {
-                        'summary': event.get('summary', 'Untitled'),
-                        'start_time': event_start_israel.strftime('%H:%M'),
-                        'end_time': event_end_israel.strftime('%H:%M')
-                    }
+            # Compare as POSIX timestamps (plain floats) instead of aware datetimes
+            start_ts = start_datetime.timestamp()
+            end_ts = end_datetime.timestamp()
+
+            days = list(self._days_spanned(start_datetime, end_datetime))
+
+            # Cached intervals can prove the slot busy without an API call
+            for day_start in days:
+                intervals = self._cached_busy_intervals(day_start)
+                if intervals is not None:
+                    conflict = self._find_conflict(intervals, start_ts, end_ts)
+                    if conflict:
+                        return conflict
+
+            # ...but "free" is always confirmed against the API (refreshing the cache)
+            for day_start in days:
+                conflict = self._find_conflict(self._fetch_busy_intervals(day_start), start_ts, end_ts)
+                if conflict:
+                    return conflict
 
             return None
 
         except Exception as e:
-            print(f"⚠️ Error checking for conflicts: {str(e)}")
+            logger.warning("⚠️ Error checking for conflicts: %s", e)
             return None  # If check fails, allow booking (fail open)
 
+    def _find_conflict(self, intervals: List[Tuple[float, float]], start_ts: float, end_ts: float) -> Optional[Dict]:
+        """Return conflict details if [start_ts, end_ts) overlaps a busy interval, None otherwise"""
+        # Intervals are sorted and disjoint, so only the last one starting
+        # before our end can overlap
+        index = bisect.bisect_left(intervals, end_ts, key=itemgetter(0))
+        if not index or intervals[index - 1][1] <= start_ts:
+            return None
+
+        busy_start, busy_end = intervals[index - 1]
+        # Convert only the conflicting interval to Israel time for display
+        return {
+            'summary': 'Busy',  # freebusy does not expose event titles
+            'start_time': datetime.fromtimestamp(busy_start, ISRAEL_TZ).strftime('%H:%M'),
+            'end_time': datetime.fromtimestamp(busy_end, ISRAEL_TZ).strftime('%H:%M')
+        }
+
+    def _busy_intervals_for_day(self, day_start: datetime) -> List[Tuple[float, float]]:
+        """
+        Busy intervals of one calendar day, served from cache for BUSY_CACHE_TTL_SECONDS
+
+        Args:
+            day_start: Midnight (Israel time) of the day
+
+        Returns:
+            Sorted, non-overlapping list of (start_ts, end_ts) POSIX timestamp tuples
+        """
+        intervals = self._cached_busy_intervals(day_start)
+        if intervals is None:
+            intervals = self._fetch_busy_intervals(day_start)
+        return intervals
+
+    def _cached_busy_intervals(self, day_start: datetime) -> Optional[List[Tuple[float, float]]]:
+        """Cached busy intervals of a day, or None if missing, expired or invalidated"""
+        with self._busy_cache_lock:
+            cached = self._busy_cache.get(day_start)
+        if cached and cached[1] is not None and monotonic() - cached[0] < BUSY_CACHE_TTL_SECONDS:
+            return cached[1]
+        return None
+
+    def _fetch_busy_intervals(self, day_start: datetime) -> List[Tuple[float, float]]:
+        """Query a day's busy intervals from the API and cache them"""
+        fetched_at = monotonic()
+        intervals = self._query_busy_intervals(day_start, day_start + timedelta(days=1))
+
+        with self._busy_cache_lock:
+            # Don't let a response that raced with a new booking overwrite its invalidation
+            current = self._busy_cache.get(day_start)
+            if current is None or current[0] <= fetched_at:
+                self._busy_cache[day_start] = (fetched_at, intervals)
+            self._prune_busy_cache()
+
+        return intervals
+
+    def find_free_slot(self, date: str, duration: int = 60) -> Optional[datetime]:
+        """
+        Find the earliest free slot of the given length on a day
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            duration: Slot length in minutes (default: 60)
+
+        Returns:
+            Timezone-aware start of the first free slot (Israel time), or None if
+            the day has no gap long enough or the calendar can't be queried
+        """
+        if self.service is None:
+            return None
+
+        try:
+            day_start = self._parse_datetime(date, "00:00")
+            intervals = self._busy_intervals_for_day(day_start)
+        except Exception as e:
+            logger.warning("⚠️ Error looking up free slots: %s", e)
+            return None
+
+        slot_length = duration * 60
+        day_end_ts = (day_start + timedelta(days=1)).timestamp()
+
+        candidate_ts = day_start.timestamp()
+        for busy_start, busy_end in intervals:
+            if busy_start - candidate_ts >= slot_length:
+                break
+            candidate_ts = max(candidate_ts, busy_end)
+
+        if day_end_ts - candidate_ts < slot_length:
+            return None
+        return datetime.fromtimestamp(candidate_ts, ISRAEL_TZ)
+
+    def _invalidate_busy_cache(self, start_datetime: datetime, end_datetime: datetime):
+        """Force the days touched by a newly created event to be re-queried"""
+        now = monotonic()
+        with self._busy_cache_lock:
+            for day_start in self._days_spanned(start_datetime, end_datetime):
+                self._busy_cache[day_start] = (now, None)
+            self._prune_busy_cache()
+
+    def _prune_busy_cache(self):
+        """Drop expired entries so the cache only holds recently queried days (caller holds the lock)"""
+        cutoff = monotonic() - BUSY_CACHE_TTL_SECONDS
+        for day_start in [day for day, (fetched_at, _) in self._busy_cache.items() if fetched_at <= cutoff]:
+            del self._busy_cache[day_start]
+
+    def _days_spanned(self, start_datetime: datetime, end_datetime: datetime):
+        """Yield the Israel-time midnight of each day overlapping [start, end)"""
+        day_start = start_datetime.astimezone(ISRAEL_TZ).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        while day_start < end_datetime:
+            yield day_start
+            day_start += timedelta(days=1)
+
+    def _query_busy_intervals(self, start_datetime: datetime, end_datetime: datetime) -> List[Tuple[float, float]]:
+        """
+        Busy intervals of the calendar in a time range, via the freebusy endpoint
+
+        This is the single source of conflicts for both create_event and
+        create_events_bulk. Like Google Calendar itself, freebusy ignores
+        transparent ("show as free") events such as default all-day events.
+
+        Args:
+            start_datetime: Start of the range (timezone-aware)
+            end_datetime: End of the range (timezone-aware)
+
+        Returns:
+            Sorted, non-overlapping list of (start_ts, end_ts) POSIX timestamp tuples
+        """
+        # API expects RFC3339 format
+        freebusy_request = self.service.freebusy().query(
+            body={
+                'timeMin': _rfc3339(start_datetime),
+                'timeMax': _rfc3339(end_datetime),
+                'items': [{'id': self.calendar_id}]
+            }
+        )
+        freebusy_result = _with_retry(lambda: freebusy_request.execute(http=self._authorized_http()))
+
+        calendar = freebusy_result.get('calendars', {}).get(self.calendar_id, {})
+        if calendar.get('errors'):
+            raise RuntimeError(f"freebusy query failed: {calendar['errors']}")
+
+        return _merge_intervals([
+            (
+                self._parse_event_datetime(busy['start']).timestamp(),
+                self._parse_event_datetime(busy['end']).timestamp()
+            )
+            for busy in calendar.get('busy', [])
+        ])
+
+    def _build_event_body(self,
+                          title: str,
+                          notes: str,
+                          start_datetime: datetime,
+                          end_datetime: datetime) -> Dict:
+        """Build the events().insert request body from the shared template"""
+        # start/end get fresh dicts so the template itself is never mutated
+        return {
+            **_EVENT_TEMPLATE,
+            'summary': title,
+            'description': notes,
+            'start': {**_EVENT_TEMPLATE['start'], 'dateTime': start_datetime.isoformat()},
+            'end': {**_EVENT_TEMPLATE['end'], 'dateTime': end_datetime.isoformat()},
+        }
+
     def _parse_event_datetime(self, dt_string: str) -> datetime:
         """
         Parse event datetime string from Google Calendar API to timezone-aware datetime
@@ -287,24 +798,18 @@ Please choose another time."""
         Returns:
             Timezone-aware datetime object
         """
-        try:
-            # Handle 'Z' suffix (UTC)
-            if dt_string.endswith('Z'):
-                dt_string = dt_string[:-1] + '+00:00'
+        # Handle 'Z' suffix (UTC)
+        if dt_string[-1] == 'Z':
+            dt_string = dt_string[:-1] + '+00:00'
 
-            # Parse ISO format with timezone
-            parsed = datetime.fromisoformat(dt_string)
+        # Parse ISO format; also accepts date-only strings (all-day events)
+        parsed = datetime.fromisoformat(dt_string)
 
-            # If no timezone info, assume Israel timezone
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=ISRAEL_TZ)
+        # If no timezone info, assume Israel timezone
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=ISRAEL_TZ)
 
-            return parsed
-
-        except ValueError:
-            # Handle date-only format (all-day events)
-            parsed = datetime.strptime(dt_string, '%Y-%m-%d')
-            return parsed.replace(tzinfo=ISRAEL_TZ)
+        return parsed
 
     def _parse_datetime(self, date_str: str, time_str: str) -> datetime:
         """
@@ -317,17 +822,23 @@ Please choose another time."""
         Returns:
             Timezone-aware datetime object in Israel timezone (Asia/Jerusalem)
         """
-        try:
-            # Combine date and time
-            datetime_str = f"{date_str} {time_str}"
-            parsed_datetime = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
+        date_match = _DATE_RE.fullmatch(str(date_str))
+        time_match = _TIME_RE.fullmatch(str(time_str))
+        if not date_match or not time_match:
+            raise ValueError(
+                f"Invalid date/time format: expected YYYY-MM-DD and HH:MM, got {date_str!r} {time_str!r}"
+            )
 
-            # Add Israel timezone to make it timezone-aware
-            parsed_datetime = parsed_datetime.replace(tzinfo=ISRAEL_TZ)
-
-            return parsed_datetime
+        try:
+            # Build the datetime from the matched integer fields (no strptime);
+            # Israel timezone makes it timezone-aware
+            return datetime(
+                *map(int, date_match.groups() + time_match.groups()),
+                tzinfo=ISRAEL_TZ
+            )
 
         except ValueError as e:
+            # Well-formed but out of range, e.g. month 13
             raise ValueError(f"Invalid date/time format: {str(e)}")
 
 # =============================================================================
@@ -335,10 +846,14 @@ Please choose another time."""
 # =============================================================================
 
 _calendar_helper = None
+_calendar_helper_lock = threading.Lock()
 
 def get_calendar_helper() -> GoogleCalendarHelper:
-    """Get or create GoogleCalendarHelper singleton instance"""
+    """Get or create GoogleCalendarHelper singleton instance (thread-safe)"""
     global _calendar_helper
     if _calendar_helper is None:
-        _calendar_helper = GoogleCalendarHelper()
+        with _calendar_helper_lock:
+            # Re-check: another thread may have created it while we waited
+            if _calendar_helper is None:
+                _calendar_helper = GoogleCalendarHelper()
     return _calendar_helper
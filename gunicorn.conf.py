@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for WhatsApp Appointment Scheduler
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_class = "gthread"
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# LLM + Calendar round trips can take well over gunicorn's 30s default
+timeout = 120
+
+# Import the app once in the master so parsed YAML configs, CrewAI agents and
+# the Calendar service are shared copy-on-write by all workers
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Recreate per-process resources that must not be inherited across fork"""
+    import app
+    from google_calendar_helper import get_calendar_helper
+
+    # The log listener thread does not survive fork
+    app.log_listener = app.setup_logging()
+
+    # Each worker gets its own HTTP connection pool
+    get_calendar_helper().reset_connections()
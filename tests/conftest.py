@@ -0,0 +1,123 @@
+"""
+Shared fixtures: an in-memory stand-in for the Google Calendar API service
+"""
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+# config.settings refuses to load without a calendar id
+os.environ.setdefault("GOOGLE_CALENDAR_ID", "test-calendar")
+
+
+class FakeRequest:
+    """An API request whose execute() returns (or raises) a canned result"""
+
+    def __init__(self, respond):
+        self._respond = respond
+
+    def execute(self, http=None):
+        return self._respond()
+
+
+class FakeBatch:
+    """new_batch_http_request() stand-in that answers each added request via the callback"""
+
+    def __init__(self, service, callback):
+        self._service = service
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self, http=None):
+        self._service.batch_sizes.append(len(self._requests))
+        error = self._service.batch_errors.get(len(self._service.batch_sizes))
+        if error is not None:
+            raise error
+        for request_id, request in self._requests:
+            self._callback(request_id, request.execute(), None)
+
+
+class FakeCalendarService:
+    """
+    Records freebusy queries and inserted event bodies
+
+    busy: list of (start, end) RFC3339 strings; freebusy returns those overlapping the query range
+    batch_errors: 1-based batch number -> exception raised by that batch's execute()
+    insert_errors: exceptions raised, in order, by the next events().insert executions
+    """
+
+    def __init__(self, calendar_id):
+        self.calendar_id = calendar_id
+        self.busy = []
+        self.freebusy_queries = []
+        self.inserted = []
+        self.batch_sizes = []
+        self.batch_errors = {}
+        self.insert_errors = []
+        self.insert_attempts = 0
+
+    def freebusy(self):
+        return SimpleNamespace(query=self._freebusy_query)
+
+    def _freebusy_query(self, body):
+        self.freebusy_queries.append(body)
+        time_min = datetime.fromisoformat(body['timeMin'])
+        time_max = datetime.fromisoformat(body['timeMax'])
+        busy = [
+            {'start': start, 'end': end} for start, end in self.busy
+            if datetime.fromisoformat(start) < time_max and datetime.fromisoformat(end) > time_min
+        ]
+        return FakeRequest(lambda: {'calendars': {self.calendar_id: {'busy': busy}}})
+
+    def events(self):
+        return SimpleNamespace(insert=self._insert)
+
+    def _insert(self, calendarId, body):
+        def respond():
+            self.insert_attempts += 1
+            if self.insert_errors:
+                raise self.insert_errors.pop(0)
+            self.inserted.append(body)
+            event_id = f"event{len(self.inserted)}"
+            return {'id': event_id, 'htmlLink': f"https://calendar.test/{event_id}"}
+        return FakeRequest(respond)
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+@pytest.fixture
+def calendar_helper():
+    """A GoogleCalendarHelper wired to a FakeCalendarService (available as .service)"""
+    google_calendar_helper = pytest.importorskip("google_calendar_helper")
+
+    helper = google_calendar_helper.GoogleCalendarHelper()
+    helper.service = FakeCalendarService(helper.calendar_id)
+    return helper
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze google_calendar_helper.monotonic; advance it with clock.advance(seconds)"""
+    google_calendar_helper = pytest.importorskip("google_calendar_helper")
+
+    fake_clock = FakeClock()
+    monkeypatch.setattr(google_calendar_helper, "monotonic", fake_clock)
+    return fake_clock
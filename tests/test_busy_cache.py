@@ -0,0 +1,126 @@
+"""
+Tests for the per-day busy interval cache behind _check_time_conflict
+
+The cache is per process while gunicorn runs several workers, so it may only
+ever answer "busy"; a slot must never be declared free without a fresh query.
+"""
+from datetime import timedelta
+
+from google_calendar_helper import BUSY_CACHE_TTL_SECONDS
+
+
+def _slot(helper, date, time, minutes=60):
+    start = helper._parse_datetime(date, time)
+    return start, start + timedelta(minutes=minutes)
+
+
+# 10:00-11:00 Israel time on 2026-11-01 (UTC+2)
+BUSY_10_TO_11 = ("2026-11-01T08:00:00Z", "2026-11-01T09:00:00Z")
+
+
+def test_cached_busy_answers_without_query(calendar_helper, clock):
+    calendar_helper.service.busy = [BUSY_10_TO_11]
+    calendar_helper.find_free_slot("2026-11-01")  # fills the cache
+    queries = len(calendar_helper.service.freebusy_queries)
+
+    conflict = calendar_helper._check_time_conflict(*_slot(calendar_helper, "2026-11-01", "10:30"))
+
+    assert conflict == {'summary': 'Busy', 'start_time': '10:00', 'end_time': '11:00'}
+    assert len(calendar_helper.service.freebusy_queries) == queries
+
+
+def test_cached_free_is_confirmed_by_fresh_query(calendar_helper, clock):
+    calendar_helper.find_free_slot("2026-11-01")  # caches an empty day
+    queries = len(calendar_helper.service.freebusy_queries)
+
+    # Another worker books the slot; this process's cache still says free
+    calendar_helper.service.busy = [BUSY_10_TO_11]
+    conflict = calendar_helper._check_time_conflict(*_slot(calendar_helper, "2026-11-01", "10:00"))
+
+    assert conflict is not None
+    assert len(calendar_helper.service.freebusy_queries) == queries + 1
+
+
+def test_free_answer_always_queries(calendar_helper, clock):
+    slot = _slot(calendar_helper, "2026-11-01", "12:00")
+
+    assert calendar_helper._check_time_conflict(*slot) is None
+    assert calendar_helper._check_time_conflict(*slot) is None
+    assert len(calendar_helper.service.freebusy_queries) == 2
+
+
+def test_fresh_query_refreshes_cache(calendar_helper, clock):
+    calendar_helper.service.busy = [BUSY_10_TO_11]
+    slot = _slot(calendar_helper, "2026-11-01", "10:00")
+
+    calendar_helper._check_time_conflict(*slot)
+    calendar_helper._check_time_conflict(*slot)
+
+    assert len(calendar_helper.service.freebusy_queries) == 1
+
+
+def test_cache_expires_after_ttl(calendar_helper, clock):
+    calendar_helper.service.busy = [BUSY_10_TO_11]
+    slot = _slot(calendar_helper, "2026-11-01", "10:00")
+    calendar_helper._check_time_conflict(*slot)
+
+    clock.advance(BUSY_CACHE_TTL_SECONDS)
+    calendar_helper._check_time_conflict(*slot)
+
+    assert len(calendar_helper.service.freebusy_queries) == 2
+
+
+def test_booking_invalidates_cached_day(calendar_helper, clock):
+    result = calendar_helper.create_event("Meeting", "2026-11-01", "10:00")
+    assert result['success']
+
+    day_start = calendar_helper._parse_datetime("2026-11-01", "00:00")
+    assert calendar_helper._cached_busy_intervals(day_start) is None
+
+
+def test_racing_fetch_does_not_overwrite_invalidation(calendar_helper, clock, monkeypatch):
+    day_start = calendar_helper._parse_datetime("2026-11-01", "00:00")
+    slot = _slot(calendar_helper, "2026-11-01", "10:00")
+
+    def query_while_booking(start_datetime, end_datetime):
+        # A booking lands while this (now stale) response is in flight
+        clock.advance(1)
+        calendar_helper._invalidate_busy_cache(*slot)
+        return []
+
+    monkeypatch.setattr(calendar_helper, "_query_busy_intervals", query_while_booking)
+    calendar_helper._fetch_busy_intervals(day_start)
+
+    assert calendar_helper._cached_busy_intervals(day_start) is None
+
+
+def test_expired_entries_are_pruned(calendar_helper, clock):
+    for day in ("2026-11-01", "2026-11-02", "2026-11-03"):
+        calendar_helper.find_free_slot(day)
+    assert len(calendar_helper._busy_cache) == 3
+
+    clock.advance(BUSY_CACHE_TTL_SECONDS)
+    calendar_helper.find_free_slot("2026-11-04")
+
+    assert list(calendar_helper._busy_cache) == [calendar_helper._parse_datetime("2026-11-04", "00:00")]
+
+
+def test_event_crossing_midnight_checks_both_days(calendar_helper, clock):
+    # 00:15-00:45 Israel time on the second day
+    calendar_helper.service.busy = [("2026-11-01T22:15:00Z", "2026-11-01T22:45:00Z")]
+
+    conflict = calendar_helper._check_time_conflict(*_slot(calendar_helper, "2026-11-01", "23:30"))
+
+    assert conflict == {'summary': 'Busy', 'start_time': '00:15', 'end_time': '00:45'}
+    assert [q['timeMin'] for q in calendar_helper.service.freebusy_queries] == [
+        "2026-10-31T22:00:00Z",
+        "2026-11-01T22:00:00Z",
+    ]
+
+
+def test_days_spanned_excludes_day_starting_at_end(calendar_helper):
+    start, end = _slot(calendar_helper, "2026-11-01", "23:00")
+
+    assert list(calendar_helper._days_spanned(start, end)) == [
+        calendar_helper._parse_datetime("2026-11-01", "00:00")
+    ]
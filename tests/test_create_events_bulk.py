@@ -0,0 +1,91 @@
+"""
+Tests for GoogleCalendarHelper.create_events_bulk against a fake Calendar service
+"""
+import pytest
+
+from google_calendar_helper import BATCH_SIZE
+
+
+def _event(time, date="2026-11-01", **extra):
+    return {'title': 'Meeting', 'date': date, 'time': time, **extra}
+
+
+def _back_to_back_events(count):
+    """count non-overlapping 5-minute events from 08:00"""
+    return [_event(f"{8 + i // 12:02d}:{i % 12 * 5:02d}", duration=5) for i in range(count)]
+
+
+def test_creates_non_conflicting_events(calendar_helper):
+    results = calendar_helper.create_events_bulk([_event("09:00"), _event("11:00", duration=30)])
+
+    assert [r['success'] for r in results] == [True, True]
+    assert [r['event_id'] for r in results] == ['event1', 'event2']
+    assert "30" in results[1]['message']
+    # One freebusy query covers every requested slot
+    assert len(calendar_helper.service.freebusy_queries) == 1
+
+
+def test_rejects_slot_overlapping_busy_interval(calendar_helper):
+    # 10:00-10:30 Israel time (UTC+2 on this date)
+    calendar_helper.service.busy = [("2026-11-01T08:00:00Z", "2026-11-01T08:30:00Z")]
+
+    results = calendar_helper.create_events_bulk([_event("09:30"), _event("10:30")])
+
+    assert results[0]['success'] is False
+    assert "occupied" in results[0]['message']
+    # Starting exactly when the busy interval ends is not a conflict
+    assert results[1]['success'] is True
+    assert len(calendar_helper.service.inserted) == 1
+
+
+def test_rejects_slot_overlapping_earlier_event_in_same_call(calendar_helper):
+    results = calendar_helper.create_events_bulk([_event("09:00"), _event("09:30")])
+
+    assert [r['success'] for r in results] == [True, False]
+    assert len(calendar_helper.service.inserted) == 1
+
+
+@pytest.mark.parametrize("bad_event", [
+    _event("09:00", date="2026-13-01"),
+    _event("9am"),
+    _event("09:00", duration=None),
+    _event("09:00", duration="an hour"),
+])
+def test_invalid_event_fails_alone(calendar_helper, bad_event):
+    results = calendar_helper.create_events_bulk([bad_event, _event("12:00")])
+
+    assert results[0]['success'] is False
+    assert "Unexpected error" in results[0]['message']
+    assert results[1]['success'] is True
+
+
+def test_failed_batch_keeps_results_of_earlier_batches(calendar_helper):
+    # Second chunk dies with a transport error rather than an HttpError
+    calendar_helper.service.batch_errors = {2: OSError("timed out")}
+    events = _back_to_back_events(BATCH_SIZE + 5)
+
+    results = calendar_helper.create_events_bulk(events)
+
+    assert len(results) == len(events)
+    assert all(r['success'] for r in results[:BATCH_SIZE])
+    assert [r['event_id'] for r in results[:2]] == ['event1', 'event2']
+    assert not any(r['success'] for r in results[BATCH_SIZE:])
+    assert all("timed out" in r['message'] for r in results[BATCH_SIZE:])
+
+
+def test_splits_inserts_into_batches(calendar_helper):
+    events = _back_to_back_events(2 * BATCH_SIZE + 1)
+
+    results = calendar_helper.create_events_bulk(events)
+
+    assert all(r['success'] for r in results)
+    assert calendar_helper.service.batch_sizes == [BATCH_SIZE, BATCH_SIZE, 1]
+
+
+def test_not_configured(calendar_helper):
+    calendar_helper.service = None
+
+    results = calendar_helper.create_events_bulk([_event("09:00"), _event("10:00")])
+
+    assert [r['success'] for r in results] == [False, False]
+    assert "not configured" in results[0]['message']
@@ -0,0 +1,56 @@
+"""
+Table-driven checks for the keyword fast path in crew._fast_route
+"""
+import os
+
+import pytest
+
+pytest.importorskip("crewai")
+
+# config.settings refuses to load without a calendar id
+os.environ.setdefault("GOOGLE_CALENDAR_ID", "test-calendar")
+
+from crew import _fast_route  # noqa: E402
+
+APPOINTMENT_EN = {"category": "APPOINTMENT", "language": "english"}
+APPOINTMENT_HE = {"category": "APPOINTMENT", "language": "hebrew"}
+
+
+@pytest.mark.parametrize("message, expected", [
+    # Booking keyword + concrete date/time: skip the router
+    ("Schedule a meeting for tomorrow at 3pm", APPOINTMENT_EN),
+    ("Book a meeting on Monday", APPOINTMENT_EN),
+    ("קבע לי פגישה מחר בשעה 10", APPOINTMENT_HE),
+    ("קבע פגישה למחר", APPOINTMENT_HE),
+    ("Book a meeting on 2026-11-02 at 10:30", APPOINTMENT_EN),
+    ("Schedule an appointment at 9", APPOINTMENT_EN),
+    ("קבע פגישה ביום שני ב-10", APPOINTMENT_HE),
+
+    # No specific date/time: the router answers these as GENERAL
+    ("I want to book a meeting", None),
+    ("אני רוצה לקבוע פגישה", None),
+    ("I'm reading a good book", None),
+
+    # Numbers that aren't a date/time, and שני/ראשון used as numbers
+    ("Book a meeting for 2 people", None),
+    ("Schedule a meeting in room 4", None),
+    ("Book a meeting with my team of 5", None),
+    ("קבע פגישה עם שני לקוחות", None),
+    ("תקבע תור ל-2 אנשים", None),
+
+    # Questions
+    ("How do I book an appointment?", None),
+    ("Can I book a meeting tomorrow at 3", None),
+
+    # Cancel / reschedule / negation
+    ("Cancel my meeting tomorrow at 3", None),
+    ("Please cancel the appointment", None),
+    ("Reschedule my appointment to Friday", None),
+    ("Don't book a meeting tomorrow", None),
+    ("תבטל את הפגישה מחר", None),
+
+    # Unrelated
+    ("What's the weather?", None),
+])
+def test_fast_route(message, expected):
+    assert _fast_route(message) == expected
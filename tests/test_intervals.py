@@ -0,0 +1,83 @@
+"""
+Table-driven checks for the busy interval helpers (merge, conflict lookup, free slot search)
+"""
+import pytest
+
+from google_calendar_helper import _merge_intervals
+
+
+@pytest.mark.parametrize("intervals, expected", [
+    ([], []),
+    ([(1, 2)], [(1, 2)]),
+    # Unsorted input
+    ([(5, 6), (1, 2)], [(1, 2), (5, 6)]),
+    # Overlapping
+    ([(1, 4), (2, 6)], [(1, 6)]),
+    # Touching intervals merge
+    ([(1, 2), (2, 3)], [(1, 3)]),
+    # Contained
+    ([(1, 10), (2, 3), (4, 5)], [(1, 10)]),
+    # Gap of any size stays split
+    ([(1, 2), (2.5, 3)], [(1, 2), (2.5, 3)]),
+])
+def test_merge_intervals(intervals, expected):
+    assert _merge_intervals(intervals) == expected
+
+
+# Busy 10:00-11:00 and 12:00-13:00; slots are (start, end) minutes after midnight
+@pytest.mark.parametrize("start_minute, end_minute, expected", [
+    # Before, between and after the busy intervals
+    (540, 570, None),
+    (665, 715, None),
+    (800, 860, None),
+    # Ending exactly when busy starts / starting exactly when it ends
+    (540, 600, None),
+    (660, 720, None),
+    (780, 840, None),
+    # Overlaps
+    (540, 601, ('10:00', '11:00')),
+    (659, 700, ('10:00', '11:00')),
+    (615, 630, ('10:00', '11:00')),
+    (690, 750, ('12:00', '13:00')),
+    (540, 840, ('12:00', '13:00')),
+])
+def test_find_conflict(calendar_helper, start_minute, end_minute, expected):
+    midnight = calendar_helper._parse_datetime("2026-11-01", "00:00").timestamp()
+    busy = [(midnight + 600 * 60, midnight + 660 * 60), (midnight + 720 * 60, midnight + 780 * 60)]
+
+    conflict = calendar_helper._find_conflict(busy, midnight + start_minute * 60, midnight + end_minute * 60)
+
+    if expected is None:
+        assert conflict is None
+    else:
+        assert conflict == {'summary': 'Busy', 'start_time': expected[0], 'end_time': expected[1]}
+
+
+# Israel time is UTC+2 on 2026-11-01
+@pytest.mark.parametrize("busy, duration, expected", [
+    # Empty day: free from midnight
+    ([], 60, "00:00"),
+    # Busy from the start of the day
+    ([("2026-10-31T22:00:00Z", "2026-10-31T23:00:00Z")], 60, "01:00"),
+    # Event from the previous evening running past midnight
+    ([("2026-10-31T21:00:00Z", "2026-10-31T22:30:00Z")], 60, "00:30"),
+    # Gap exactly as long as the slot
+    ([("2026-10-31T22:00:00Z", "2026-10-31T23:00:00Z"),
+      ("2026-11-01T00:00:00Z", "2026-11-01T21:00:00Z")], 60, "01:00"),
+    # Gap one minute too short: first fit is after the last event
+    ([("2026-10-31T22:00:00Z", "2026-10-31T23:00:00Z"),
+      ("2026-10-31T23:59:00Z", "2026-11-01T20:00:00Z")], 60, "22:00"),
+    # Exactly enough room at the end of the day
+    ([("2026-10-31T22:00:00Z", "2026-11-01T21:00:00Z")], 60, "23:00"),
+    # Not enough room anywhere
+    ([("2026-10-31T22:00:00Z", "2026-11-01T21:30:00Z")], 60, None),
+])
+def test_find_free_slot(calendar_helper, busy, duration, expected):
+    calendar_helper.service.busy = busy
+
+    slot = calendar_helper.find_free_slot("2026-11-01", duration)
+
+    if expected is None:
+        assert slot is None
+    else:
+        assert slot.strftime("%Y-%m-%d %H:%M") == f"2026-11-01 {expected}"
@@ -0,0 +1,106 @@
+"""
+Tests for the Calendar API retry policy (_is_retryable / _with_retry)
+"""
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+import google_calendar_helper
+from google_calendar_helper import RETRY_ATTEMPTS, _with_retry
+
+
+def _http_error(status, content=b''):
+    return HttpError(httplib2.Response({'status': status}), content)
+
+
+RATE_LIMITED = b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}'
+FORBIDDEN = b'{"error": {"errors": [{"reason": "forbidden"}]}}'
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping"""
+    delays = []
+    monkeypatch.setattr(google_calendar_helper, "sleep", delays.append)
+    return delays
+
+
+def _failing(*errors, result="ok"):
+    """Callable raising the given errors in turn, then returning result; counts calls"""
+    pending = list(errors)
+
+    def call():
+        call.count += 1
+        if pending:
+            raise pending.pop(0)
+        return result
+
+    call.count = 0
+    return call
+
+
+@pytest.mark.parametrize("error", [
+    _http_error(429),
+    _http_error(403, RATE_LIMITED),
+    _http_error(500),
+    _http_error(503),
+])
+def test_retries_transient_errors(sleeps, error):
+    call = _failing(error)
+
+    assert _with_retry(call) == "ok"
+    assert call.count == 2
+    assert len(sleeps) == 1
+
+
+@pytest.mark.parametrize("error", [
+    _http_error(403, FORBIDDEN),
+    _http_error(400),
+    _http_error(404),
+])
+def test_does_not_retry_permanent_errors(sleeps, error):
+    call = _failing(error)
+
+    with pytest.raises(HttpError):
+        _with_retry(call)
+    assert call.count == 1
+    assert sleeps == []
+
+
+def test_backoff_doubles(sleeps):
+    call = _failing(*[_http_error(503)] * 3)
+
+    _with_retry(call, base=1.0)
+
+    assert [int(delay) for delay in sleeps] == [1, 2, 4]
+
+
+def test_last_attempt_reraises(sleeps):
+    errors = [_http_error(503) for _ in range(RETRY_ATTEMPTS)]
+    call = _failing(*errors)
+
+    with pytest.raises(HttpError) as raised:
+        _with_retry(call)
+    assert raised.value is errors[-1]
+    assert call.count == RETRY_ATTEMPTS
+    assert len(sleeps) == RETRY_ATTEMPTS - 1
+
+
+def test_insert_retries_rate_limiting(calendar_helper, sleeps):
+    calendar_helper.service.insert_errors = [_http_error(429)]
+
+    result = calendar_helper.create_event("Meeting", "2026-11-01", "10:00")
+
+    assert result['success']
+    assert calendar_helper.service.insert_attempts == 2
+
+
+def test_insert_does_not_retry_server_errors(calendar_helper, sleeps):
+    # The insert may have gone through; repeating it could create a duplicate event
+    calendar_helper.service.insert_errors = [_http_error(503)]
+
+    result = calendar_helper.create_event("Meeting", "2026-11-01", "10:00")
+
+    assert not result['success']
+    assert calendar_helper.service.insert_attempts == 1
+    assert calendar_helper.service.inserted == []